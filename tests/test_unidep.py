@@ -46,12 +46,12 @@ def setup_test_files(
     d1 = tmp_path / "dir1"
     d1.mkdir()
     f1 = d1 / "requirements.yaml"
-    f1.write_text("dependencies:\n  - numpy\n  - conda: mumps")
+    f1.write_bytes(b"dependencies:\n  - numpy\n  - conda: mumps")
 
     d2 = tmp_path / "dir2"
     d2.mkdir()
     f2 = d2 / "requirements.yaml"
-    f2.write_text("dependencies:\n  - pip: pandas")
+    f2.write_bytes(b"dependencies:\n  - pip: pandas")
     f1 = maybe_as_toml(request.param, f1)
     f2 = maybe_as_toml(request.param, f2)
     return (f1, f2)
@@ -77,15 +77,11 @@ def test_find_requirements_files(
 
 def test_find_requirements_files_depth(tmp_path: Path) -> None:
     # Create a nested directory structure
-    (tmp_path / "dir1").mkdir()
-    (tmp_path / "dir1/dir2").mkdir()
-    (tmp_path / "dir1/dir2/dir3").mkdir()
+    (tmp_path / "dir1/dir2/dir3").mkdir(parents=True)
 
     # Create test files
-    (tmp_path / "requirements.yaml").touch()
-    (tmp_path / "dir1/requirements.yaml").touch()
-    (tmp_path / "dir1/dir2/requirements.yaml").touch()
-    (tmp_path / "dir1/dir2/dir3/requirements.yaml").touch()
+    for folder in ["", "dir1", "dir1/dir2", "dir1/dir2/dir3"]:
+        (tmp_path / folder / "requirements.yaml").write_bytes(b"")
 
     # Test depth=0
     assert len(find_requirements_files(tmp_path, depth=0)) == 1
@@ -103,23 +99,22 @@ def test_find_requirements_files_depth(tmp_path: Path) -> None:
     assert len(find_requirements_files(tmp_path, depth=4)) == 4
 
 
+_REQS_PARSE = b"""\
+dependencies:
+    - foo >1 # [linux64]
+    - foo # [unix]
+    - bar >1
+    - bar
+"""
+
+
 @pytest.mark.parametrize("toml_or_yaml", ["toml", "yaml"])
 def test_parse_requirements(
     toml_or_yaml: Literal["toml", "yaml"],
     tmp_path: Path,
 ) -> None:
     p = tmp_path / "requirements.yaml"
-    p.write_text(
-        textwrap.dedent(
-            """\
-            dependencies:
-                - foo >1 # [linux64]
-                - foo # [unix]
-                - bar >1
-                - bar
-            """,
-        ),
-    )
+    p.write_bytes(_REQS_PARSE)
     p = maybe_as_toml(toml_or_yaml, p)
     requirements = parse_requirements(p, verbose=False)
     assert requirements.requirements == {
@@ -178,72 +173,67 @@ def test_parse_requirements(
     }
 
 
-@pytest.mark.parametrize("verbose", [True, False])
-def test_generate_conda_env_file(
-    tmp_path: Path,
-    verbose: bool,  # noqa: FBT001
-    setup_test_files: tuple[Path, Path],
-) -> None:
-    output_file = tmp_path / "environment.yaml"
-    requirements = parse_requirements(*setup_test_files, verbose=verbose)
+@pytest.fixture
+def setup_env_spec(setup_test_files: tuple[Path, Path]) -> CondaEnvironmentSpec:
+    requirements = parse_requirements(*setup_test_files)
     resolved = resolve_conflicts(
         requirements.requirements,
         requirements.platforms,
     )
-    env_spec = create_conda_env_specification(
+    return create_conda_env_specification(
         resolved,
         requirements.channels,
         requirements.platforms,
     )
 
-    write_conda_environment_file(env_spec, str(output_file), verbose=verbose)
 
-    with output_file.open() as f, YAML(typ="safe") as yaml:
-        env_data = yaml.load(f)
-        assert "dependencies" in env_data
+@pytest.mark.parametrize("verbose", [True, False])
+def test_generate_conda_env_file(
+    tmp_path: Path,
+    verbose: bool,  # noqa: FBT001
+    setup_env_spec: CondaEnvironmentSpec,
+) -> None:
+    output_file = tmp_path / "environment.yaml"
+    write_conda_environment_file(setup_env_spec, str(output_file), verbose=verbose)
+
+    text = output_file.read_text()
+    assert "\ndependencies:\n" in text
+    assert "\n  - numpy\n" in text
+    assert "\n  - pip:\n    - pandas\n" in text
+    if not verbose:  # `verbose` does not change the file, so parse it only once
+        env_data = YAML(typ="safe").load(text)
         assert "numpy" in env_data["dependencies"]
         assert {"pip": ["pandas"]} in env_data["dependencies"]
 
 
 def test_generate_conda_env_stdout(
-    setup_test_files: tuple[Path, Path],
+    setup_env_spec: CondaEnvironmentSpec,
     capsys: pytest.CaptureFixture,
 ) -> None:
-    requirements = parse_requirements(*setup_test_files)
-    resolved = resolve_conflicts(
-        requirements.requirements,
-        requirements.platforms,
-    )
-    env_spec = create_conda_env_specification(
-        resolved,
-        requirements.channels,
-        requirements.platforms,
-    )
-    write_conda_environment_file(env_spec, output_file=None)
+    write_conda_environment_file(setup_env_spec, output_file=None)
     captured = capsys.readouterr()
     assert "dependencies" in captured.out
     assert "numpy" in captured.out
     assert "- pandas" in captured.out
 
 
+_REQS_PLATFORM_SELECTORS = b"""\
+dependencies:
+    - yolo  # [arm64]
+    - foo  # [linux64]
+    - conda: bar  # [win]
+    - pip: pip-package
+    - pip: pip-package2  # [arm64]
+"""
+
+
 @pytest.mark.parametrize("toml_or_yaml", ["toml", "yaml"])
 def test_create_conda_env_specification_platforms(
     toml_or_yaml: Literal["toml", "yaml"],
     tmp_path: Path,
 ) -> None:
     p = tmp_path / "requirements.yaml"
-    p.write_text(
-        textwrap.dedent(
-            """\
-            dependencies:
-                - yolo  # [arm64]
-                - foo  # [linux64]
-                - conda: bar  # [win]
-                - pip: pip-package
-                - pip: pip-package2  # [arm64]
-            """,
-        ),
-    )
+    p.write_bytes(_REQS_PLATFORM_SELECTORS)
     p = maybe_as_toml(toml_or_yaml, p)
     requirements = parse_requirements(p)
     resolved = resolve_conflicts(
@@ -320,6 +310,7 @@ def test_verbose_output(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
 
     write_conda_environment_file(
         CondaEnvironmentSpec(channels=[], platforms=[], conda=[], pip=[]),
+        tmp_path / "environment.yaml",
         verbose=True,
     )
     captured = capsys.readouterr()
@@ -770,22 +761,21 @@ def test_filter_pip_and_conda(
     ]
 
 
+_REQS_DUPLICATES_VERSION = b"""\
+dependencies:
+    - foo >1 # [linux64]
+    - foo # [linux64]
+    - bar
+"""
+
+
 @pytest.mark.parametrize("toml_or_yaml", ["toml", "yaml"])
 def test_duplicates_with_version(
     toml_or_yaml: Literal["toml", "yaml"],
     tmp_path: Path,
 ) -> None:
     p = tmp_path / "requirements.yaml"
-    p.write_text(
-        textwrap.dedent(
-            """\
-            dependencies:
-                - foo >1 # [linux64]
-                - foo # [linux64]
-                - bar
-            """,
-        ),
-    )
+    p.write_bytes(_REQS_DUPLICATES_VERSION)
     p = maybe_as_toml(toml_or_yaml, p)
     requirements = parse_requirements(p, verbose=False)
     assert requirements.requirements == {
@@ -880,21 +870,20 @@ def test_duplicates_with_version(
     ]
 
 
+_REQS_DUPLICATES_PLATFORMS = b"""\
+dependencies:
+    - foo >1 # [linux64]
+    - foo <=2 # [linux]
+"""
+
+
 @pytest.mark.parametrize("toml_or_yaml", ["toml", "yaml"])
 def test_duplicates_different_platforms(
     toml_or_yaml: Literal["toml", "yaml"],
     tmp_path: Path,
 ) -> None:
     p = tmp_path / "requirements.yaml"
-    p.write_text(
-        textwrap.dedent(
-            """\
-            dependencies:
-                - foo >1 # [linux64]
-                - foo <=2 # [linux]
-            """,
-        ),
-    )
+    p.write_bytes(_REQS_DUPLICATES_PLATFORMS)
     p = maybe_as_toml(toml_or_yaml, p)
     requirements = parse_requirements(p, verbose=False)
     assert requirements.requirements == {
@@ -1167,21 +1156,20 @@ def test_expand_none_with_different_platforms(
     ]
 
 
+_REQS_DIFFERENT_PINS = b"""\
+dependencies:
+    - pip: foo >1
+      conda: foo <1
+"""
+
+
 @pytest.mark.parametrize("toml_or_yaml", ["toml", "yaml"])
 def test_different_pins_on_conda_and_pip(
     toml_or_yaml: Literal["toml", "yaml"],
     tmp_path: Path,
 ) -> None:
     p = tmp_path / "requirements.yaml"
-    p.write_text(
-        textwrap.dedent(
-            """\
-            dependencies:
-                - pip: foo >1
-                  conda: foo <1
-            """,
-        ),
-    )
+    p.write_bytes(_REQS_DIFFERENT_PINS)
     p = maybe_as_toml(toml_or_yaml, p)
     requirements = parse_requirements(p, verbose=False)
     assert requirements.requirements == {
@@ -1233,21 +1221,20 @@ def test_different_pins_on_conda_and_pip(
     assert python_deps == ["foo >1"]
 
 
+_REQS_PIP_PINNED = b"""\
+dependencies:
+    - pip: foo >1
+      conda: foo
+"""
+
+
 @pytest.mark.parametrize("toml_or_yaml", ["toml", "yaml"])
 def test_pip_pinned_conda_not(
     toml_or_yaml: Literal["toml", "yaml"],
     tmp_path: Path,
 ) -> None:
     p = tmp_path / "requirements.yaml"
-    p.write_text(
-        textwrap.dedent(
-            """\
-            dependencies:
-                - pip: foo >1
-                  conda: foo
-            """,
-        ),
-    )
+    p.write_bytes(_REQS_PIP_PINNED)
     p = maybe_as_toml(toml_or_yaml, p)
     requirements = parse_requirements(p, verbose=False)
     resolved = resolve_conflicts(requirements.requirements, requirements.platforms)
@@ -1264,21 +1251,20 @@ def test_pip_pinned_conda_not(
     assert python_deps == ["foo >1"]
 
 
+_REQS_CONDA_PINNED = b"""\
+dependencies:
+    - pip: foo
+      conda: foo >1
+"""
+
+
 @pytest.mark.parametrize("toml_or_yaml", ["toml", "yaml"])
 def test_conda_pinned_pip_not(
     toml_or_yaml: Literal["toml", "yaml"],
     tmp_path: Path,
 ) -> None:
     p = tmp_path / "requirements.yaml"
-    p.write_text(
-        textwrap.dedent(
-            """\
-            dependencies:
-                - pip: foo
-                  conda: foo >1
-            """,
-        ),
-    )
+    p.write_bytes(_REQS_CONDA_PINNED)
     p = maybe_as_toml(toml_or_yaml, p)
     requirements = parse_requirements(p, verbose=False)
     resolved = resolve_conflicts(requirements.requirements, requirements.platforms)
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -57,68 +56,46 @@ def test_build_pep508_environment_marker() -> None:
     )
 
 
-def test_detect_platform() -> None:
-    with patch("platform.system", return_value="Linux"), patch(
-        "platform.machine",
-        return_value="x86_64",
-    ):
-        assert identify_current_platform() == "linux-64"
-
-    with patch("platform.system", return_value="Linux"), patch(
-        "platform.machine",
-        return_value="aarch64",
-    ):
-        assert identify_current_platform() == "linux-aarch64"
-
-    with patch("platform.system", return_value="Darwin"), patch(
-        "platform.machine",
-        return_value="x86_64",
-    ):
-        assert identify_current_platform() == "osx-64"
-
-    with patch("platform.system", return_value="Darwin"), patch(
-        "platform.machine",
-        return_value="arm64",
-    ):
-        assert identify_current_platform() == "osx-arm64"
-
-    with patch("platform.system", return_value="Windows"), patch(
-        "platform.machine",
-        return_value="AMD64",
-    ):
-        assert identify_current_platform() == "win-64"
-
-    with patch("platform.system", return_value="Linux"), patch(
-        "platform.machine",
-        return_value="unknown",
-    ), pytest.raises(UnsupportedPlatformError, match="Unsupported Linux architecture"):
-        identify_current_platform()
-
-    with patch("platform.system", return_value="Darwin"), patch(
-        "platform.machine",
-        return_value="unknown",
-    ), pytest.raises(UnsupportedPlatformError, match="Unsupported macOS architecture"):
-        identify_current_platform()
-
-    with patch("platform.system", return_value="Windows"), patch(
-        "platform.machine",
-        return_value="unknown",
-    ), pytest.raises(
-        UnsupportedPlatformError,
-        match="Unsupported Windows architecture",
-    ):
-        identify_current_platform()
-
-    with patch("platform.system", return_value="Linux"), patch(
-        "platform.machine",
-        return_value="ppc64le",
-    ):
-        assert identify_current_platform() == "linux-ppc64le"
-
-    with patch("platform.system", return_value="Unknown"), patch(
-        "platform.machine",
-        return_value="x86_64",
-    ), pytest.raises(UnsupportedPlatformError, match="Unsupported operating system"):
+@pytest.mark.parametrize(
+    ("system", "machine", "expected"),
+    [
+        ("Linux", "x86_64", "linux-64"),
+        ("Linux", "aarch64", "linux-aarch64"),
+        ("Linux", "ppc64le", "linux-ppc64le"),
+        ("Darwin", "x86_64", "osx-64"),
+        ("Darwin", "arm64", "osx-arm64"),
+        ("Windows", "AMD64", "win-64"),
+    ],
+)
+def test_detect_platform(
+    monkeypatch: pytest.MonkeyPatch,
+    system: str,
+    machine: str,
+    expected: str,
+) -> None:
+    monkeypatch.setattr("platform.system", lambda: system)
+    monkeypatch.setattr("platform.machine", lambda: machine)
+    assert identify_current_platform() == expected
+
+
+@pytest.mark.parametrize(
+    ("system", "machine", "match"),
+    [
+        ("Linux", "unknown", "Unsupported Linux architecture"),
+        ("Darwin", "unknown", "Unsupported macOS architecture"),
+        ("Windows", "unknown", "Unsupported Windows architecture"),
+        ("Unknown", "x86_64", "Unsupported operating system"),
+    ],
+)
+def test_detect_platform_unsupported(
+    monkeypatch: pytest.MonkeyPatch,
+    system: str,
+    machine: str,
+    match: str,
+) -> None:
+    monkeypatch.setattr("platform.system", lambda: system)
+    monkeypatch.setattr("platform.machine", lambda: machine)
+    with pytest.raises(UnsupportedPlatformError, match=match):
         identify_current_platform()
 
 
@@ -186,7 +163,7 @@ def test_parse_package_str_with_selector() -> None:
     # Test with multiple selectors
     assert parse_package_str("numpy:linux64 win64") == ("numpy", None, "linux64 win64")
     with pytest.raises(ValueError, match="Invalid platform selector: `unknown`"):
-        assert parse_package_str("numpy:linux64 unknown")
+        parse_package_str("numpy:linux64 unknown")
 
 
 def test_parse_package_str_with_extras() -> None:
@@ -221,14 +198,14 @@ def test_parse_package_str_with_extras() -> None:
     )
 
 
+_LINUX_PLATFORMS = frozenset({"linux-64", "linux-aarch64", "linux-ppc64le"})
+_UNIX_PLATFORMS = _LINUX_PLATFORMS | {"osx-64", "osx-arm64"}
+
+
 def test_extract_matching_platforms() -> None:
     # Test with a line having a linux selector
     content_linux = "dependency1  # [linux]"
-    assert set(extract_matching_platforms(content_linux)) == {
-        "linux-64",
-        "linux-aarch64",
-        "linux-ppc64le",
-    }
+    assert set(extract_matching_platforms(content_linux)) == _LINUX_PLATFORMS
 
     # Test with a line having a win selector
     content_win = "dependency2  # [win]"
@@ -248,25 +225,11 @@ def test_extract_matching_platforms() -> None:
 
     # Test with a line having a unix selector
     content_unix = "dependency5  # [unix]"
-    expected_unix = {
-        "linux-64",
-        "linux-aarch64",
-        "linux-ppc64le",
-        "osx-64",
-        "osx-arm64",
-    }
-    assert set(extract_matching_platforms(content_unix)) == expected_unix
+    assert set(extract_matching_platforms(content_unix)) == _UNIX_PLATFORMS
 
     # Test with a line having multiple selectors
     content_multi = "dependency7  # [linux64 unix]"
-    expected_multi = {
-        "linux-64",
-        "linux-aarch64",
-        "linux-ppc64le",
-        "osx-64",
-        "osx-arm64",
-    }
-    assert set(extract_matching_platforms(content_multi)) == expected_multi
+    assert set(extract_matching_platforms(content_multi)) == _UNIX_PLATFORMS
 
     # Test with a line having multiple []
     content_multi = "dependency7  # [linux64] [win]"
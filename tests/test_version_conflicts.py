@@ -14,28 +14,36 @@ from unidep._conflicts import (
 )
 from unidep.platform_definitions import Spec
 
+_SPECS_TO_COMBINE = {
+    None: {
+        "conda": [
+            Spec(name="numpy", which="conda", pin=">1"),
+            Spec(name="numpy", which="conda", pin="<2"),
+        ],
+    },
+}
+_COMBINED_SPEC = {
+    None: {
+        "conda": Spec(name="numpy", which="conda", pin=">1,<2"),
+    },
+}
+
 
 def test_combining_versions() -> None:
-    data = {
-        None: {
-            "conda": [
-                Spec(name="numpy", which="conda", pin=">1"),
-                Spec(name="numpy", which="conda", pin="<2"),
-            ],
-        },
-    }
-    resolved = _combine_pinning_within_platform(data)  # type: ignore[arg-type]
-    assert resolved == {
-        None: {
-            "conda": Spec(name="numpy", which="conda", pin=">1,<2"),
-        },
-    }
-
-
-@pytest.mark.parametrize("operator", ["<", "<=", ">", ">=", "="])
-@pytest.mark.parametrize("version", ["1", "1.0", "1.0.0", "1.0.0rc1"])
-def test_is_valid_pinning(operator: str, version: str) -> None:
-    assert _is_valid_pinning(f"{operator}{version}")
+    resolved = _combine_pinning_within_platform(_SPECS_TO_COMBINE)  # type: ignore[arg-type]
+    assert resolved == _COMBINED_SPEC
+
+
+@pytest.mark.parametrize(
+    "pinning",
+    [
+        f"{operator}{version}"
+        for operator in ["<", "<=", ">", ">=", "="]
+        for version in ["1", "1.0", "1.0.0", "1.0.0rc1"]
+    ],
+)
+def test_is_valid_pinning(pinning: str) -> None:
+    assert _is_valid_pinning(pinning)
 
 
 @pytest.mark.parametrize(
@@ -93,7 +101,7 @@ def test_combine_version_pinnings(pinnings: list[str], expected: str) -> None:
 )
 def test_invalid_pinnings(pinnings: list[str]) -> None:
     with pytest.raises(VersionConflictError, match="Invalid version pinning"):
-        assert combine_version_pinnings(pinnings)
+        combine_version_pinnings(pinnings)
 
 
 @pytest.mark.parametrize(
@@ -109,35 +117,26 @@ def test_contradictory_pinnings(pinnings: list[str]) -> None:
         combine_version_pinnings(pinnings)
 
 
-def test_exact_pinning_with_contradictory_ranges() -> None:
-    with pytest.raises(
-        VersionConflictError,
-        match="Contradictory version pinnings found for `None`: =3 and <2",
-    ):
-        combine_version_pinnings(["=3", "<2", ">4"])
-
-    with pytest.raises(
-        VersionConflictError,
-        match="Contradictory version pinnings found for `None`: =3 and <1",
-    ):
-        assert combine_version_pinnings(["=3", "<1", ">4"])
-
-
-def test_multiple_exact_pinnings() -> None:
-    with pytest.raises(
-        VersionConflictError,
-        match="Multiple exact version pinnings found: =2, =3",
-    ):
-        combine_version_pinnings(["=2", "=3"])
-
-
-def test_general_contradictory_pinnings() -> None:
-    # This test ensures that contradictory non-exact pinnings raise a VersionConflictError
-    with pytest.raises(
-        VersionConflictError,
-        match="Contradictory version pinnings found for `None`: >=2 and <1",
-    ):
-        combine_version_pinnings([">=2", "<1"])
+@pytest.mark.parametrize(
+    ("pinnings", "match"),
+    [
+        # Exact pinning with contradictory ranges
+        (
+            ["=3", "<2", ">4"],
+            "Contradictory version pinnings found for `None`: =3 and <2",
+        ),
+        (
+            ["=3", "<1", ">4"],
+            "Contradictory version pinnings found for `None`: =3 and <1",
+        ),
+        (["=2", "=3"], "Multiple exact version pinnings found: =2, =3"),
+        # Contradictory non-exact pinnings
+        ([">=2", "<1"], "Contradictory version pinnings found for `None`: >=2 and <1"),
+    ],
+)
+def test_conflicting_pinnings(pinnings: list[str], match: str) -> None:
+    with pytest.raises(VersionConflictError, match=match):
+        combine_version_pinnings(pinnings)
 
 
 def test_is_redundant() -> None:
@@ -34,7 +34,7 @@ from unidep._setuptools_integration import (
     get_python_dependencies,
 )
 from unidep._version import __version__
-from unidep.platform_definitions import Platform
+from unidep.platform_definitions import VALID_PLATFORMS, Platform
 from unidep.utils import (
     add_comment_to_file,
     escape_unicode,
@@ -47,9 +47,9 @@ from unidep.utils import (
 )
 
 if sys.version_info >= (3, 8):
-    from typing import Literal, get_args
+    from typing import Literal
 else:  # pragma: no cover
-    from typing_extensions import Literal, get_args
+    from typing_extensions import Literal
 
 try:  # pragma: no cover
     from rich_argparse import RichHelpFormatter
@@ -132,7 +132,7 @@ def _add_common_args(  # noqa: PLR0912, C901
             type=str,
             action="append",  # Allow multiple instances of -p
             default=[],
-            choices=get_args(Platform),
+            choices=VALID_PLATFORMS,
             help="The platform(s) to get the requirements for. "
             "Multiple platforms can be specified. "
             f"By default, the current platform (`{current_platform}`) is used.",
@@ -6,8 +6,6 @@ Conda environment file generation functions.
 from __future__ import annotations
 
 import sys
-from collections import defaultdict
-from copy import deepcopy
 from typing import TYPE_CHECKING, NamedTuple, cast
 
 from ruamel.yaml import YAML
@@ -19,13 +17,14 @@ from unidep._conflicts import (
 )
 from unidep.platform_definitions import (
     PLATFORM_SELECTOR_MAP,
+    VALID_CONDA_PLATFORMS,
     CondaPip,
     CondaPlatform,
     Platform,
     Spec,
 )
 from unidep.utils import (
-    add_comment_to_file,
+    _header_comment,
     build_pep508_environment_marker,
     warn,
 )
@@ -34,9 +33,9 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 if sys.version_info >= (3, 8):
-    from typing import Literal, get_args
+    from typing import Literal
 else:  # pragma: no cover
-    from typing_extensions import Literal, get_args
+    from typing_extensions import Literal
 
 
 class CondaEnvironmentSpec(NamedTuple):
@@ -51,7 +50,7 @@ class CondaEnvironmentSpec(NamedTuple):
 def _conda_sel(sel: str) -> CondaPlatform:
     """Return the allowed `sel(platform)` string."""
     _platform = sel.split("-", 1)[0]
-    assert _platform in get_args(CondaPlatform), f"Invalid platform: {_platform}"
+    assert _platform in VALID_CONDA_PLATFORMS, f"Invalid platform: {_platform}"
     return cast(CondaPlatform, _platform)
 
 
@@ -85,14 +84,11 @@ def _resolve_multiple_platform_conflicts(
     per Conda platform, discarding others. This approach guarantees uniform
     metadata across different but equivalent platforms.
     """
-    valid: dict[
-        CondaPlatform,
-        dict[Spec, list[Platform | None]],
-    ] = defaultdict(lambda: defaultdict(list))
+    valid: dict[CondaPlatform, dict[Spec, list[Platform | None]]] = {}
     for _platform, spec in platform_to_spec.items():
         assert _platform is not None
         conda_platform = _conda_sel(_platform)
-        valid[conda_platform][spec].append(_platform)
+        valid.setdefault(conda_platform, {}).setdefault(spec, []).append(_platform)
 
     for conda_platform, spec_to_platforms in valid.items():
         # We cannot distinguish between e.g., linux-64 and linux-aarch64
@@ -211,7 +207,10 @@ def write_conda_environment_file(
     verbose: bool = False,
 ) -> None:
     """Generate a conda environment.yaml file or print to stdout."""
-    resolved_dependencies = deepcopy(env_spec.conda)
+    # Copy the comments once, `deepcopy` of a `CommentedSeq` copies them per item
+    resolved_dependencies = CommentedSeq(env_spec.conda)
+    if isinstance(env_spec.conda, CommentedSeq):
+        env_spec.conda.copy_attributes(resolved_dependencies, memo={})
     if env_spec.pip:
         resolved_dependencies.append({"pip": env_spec.pip})  # type: ignore[arg-type, dict-item]
     env_data = CommentedMap({"name": name})
@@ -229,9 +228,10 @@ def write_conda_environment_file(
         if verbose:
             print(f"📝 Generating environment file at `{output_file}`")
         with open(output_file, "w") as f:  # noqa: PTH123
+            # Write the header first instead of re-reading the file afterwards
+            f.write(_header_comment())
             yaml.dump(env_data, f)
         if verbose:
             print("📝 Environment file generated successfully.")
-        add_comment_to_file(output_file)
     else:
         yaml.dump(env_data, sys.stdout)
@@ -9,7 +9,6 @@ import shutil
 import subprocess
 import sys
 import tempfile
-import urllib.request
 from collections import defaultdict
 from functools import partial
 from pathlib import Path
@@ -388,6 +387,8 @@ def _download_and_get_package_names(
             " Please install it with `pip install conda-package-handling`.",
         )
         sys.exit(1)
+    import urllib.request  # only needed here, slow to import
+
     url = package["url"]
     if package["manager"] != "conda":  # pragma: no cover
         return None
@@ -5,23 +5,16 @@ Verion conflict detections and resolution.
 
 from __future__ import annotations
 
-import sys
-from collections import defaultdict
+import functools
 from typing import TYPE_CHECKING
 
 from packaging import version
 
-from unidep.platform_definitions import Platform, Spec
-from unidep.utils import defaultdict_to_dict, warn
-
-if sys.version_info >= (3, 8):
-    from typing import get_args
-else:  # pragma: no cover
-    from typing_extensions import get_args
-
+from unidep.platform_definitions import VALID_PLATFORMS, Spec
+from unidep.utils import warn
 
 if TYPE_CHECKING:
-    from unidep.platform_definitions import CondaPip
+    from unidep.platform_definitions import CondaPip, Platform
 
 VALID_OPERATORS = ["<=", ">=", "<", ">", "=", "!="]
 _REPO_URL = "https://github.com/basnijholt/unidep"
@@ -39,18 +32,20 @@ def _prepare_specs_for_conflict_resolution(
     """
     prepared_data = {}
     for package, spec_list in requirements.items():
-        grouped_specs: dict[Platform | None, dict[CondaPip, list[Spec]]] = defaultdict(
-            lambda: defaultdict(list),
-        )
+        # Plain dicts, so no extra pass is needed to convert nested defaultdicts
+        grouped_specs: dict[Platform | None, dict[CondaPip, list[Spec]]] = {}
         for spec in spec_list:
             _platforms = spec.platforms()
             if _platforms is None:
                 _platforms = [None]  # type: ignore[list-item]
             for _platform in _platforms:
-                grouped_specs[_platform][spec.which].append(spec)
+                grouped_specs.setdefault(_platform, {}).setdefault(
+                    spec.which,
+                    [],
+                ).append(spec)
 
         prepared_data[package] = grouped_specs
-    return defaultdict_to_dict(prepared_data)
+    return prepared_data
 
 
 def _pop_unused_platforms_and_maybe_expand_none(
@@ -58,9 +53,7 @@ def _pop_unused_platforms_and_maybe_expand_none(
     platforms: list[Platform] | None,
 ) -> None:
     """Expand `None` to all platforms if there is a platform besides None."""
-    allowed_platforms = get_args(Platform)
-    if platforms:
-        allowed_platforms = platforms  # type: ignore[assignment]
+    allowed_platforms = platforms or VALID_PLATFORMS
 
     # If there is a platform besides None, expand None to all platforms
     if len(platform_data) > 1 and None in platform_data:
@@ -74,13 +67,15 @@ def _pop_unused_platforms_and_maybe_expand_none(
     # Remove platforms that are not allowed
     to_pop = platform_data.keys() - allowed_platforms
     to_pop.discard(None)
-    for _platform in to_pop:
-        platform_data.pop(_platform)
+    for unused_platform in to_pop:
+        platform_data.pop(unused_platform)
 
 
 def _maybe_new_spec_with_combined_pinnings(
     specs: list[Spec],
 ) -> Spec:
+    if len(specs) == 1:  # Nothing to combine, the common case
+        return specs[0]
     pinned_specs = [m for m in specs if m.pin is not None]
     if len(pinned_specs) == 1:
         return pinned_specs[0]
@@ -182,8 +177,8 @@ def resolve_conflicts(
     mapping sources to a single `Spec` object.
 
     """
-    if platforms and not set(platforms).issubset(get_args(Platform)):
-        msg = f"Invalid platform: {platforms}, must contain only {get_args(Platform)}"
+    if platforms and not set(platforms).issubset(VALID_PLATFORMS):
+        msg = f"Invalid platform: {platforms}, must contain only {VALID_PLATFORMS}"
         raise VersionConflictError(msg)
 
     _add_optional_dependencies(requirements, optional_dependencies)
@@ -191,16 +186,16 @@ def resolve_conflicts(
     prepared = _prepare_specs_for_conflict_resolution(requirements)
     for data in prepared.values():
         _pop_unused_platforms_and_maybe_expand_none(data, platforms)
-    resolved = {
-        pkg: _combine_pinning_within_platform(data) for pkg, data in prepared.items()
+    return {
+        pkg: {
+            _platform: _resolve_conda_pip_conflicts(sources)
+            for _platform, sources in _combine_pinning_within_platform(data).items()
+        }
+        for pkg, data in prepared.items()
     }
 
-    for _platforms in resolved.values():
-        for _platform, sources in _platforms.items():
-            _platforms[_platform] = _resolve_conda_pip_conflicts(sources)
-    return resolved
-
 
+@functools.lru_cache
 def _parse_pinning(pinning: str) -> tuple[str, version.Version]:
     """Separates the operator and the version number."""
     pinning = pinning.strip()
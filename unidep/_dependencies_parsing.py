@@ -62,8 +62,12 @@ def find_requirements_files(
             print(f"🔍 Scanning in `{path}` at depth {current_depth}")
         if current_depth > depth:
             return
-        for child in sorted(path.iterdir()):
-            if child.is_dir():
+        # `os.scandir` caches the file type, avoiding a `stat` call per child
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: Path(e.path))
+        for entry in entries:
+            child = Path(entry.path)
+            if entry.is_dir():
                 _scan_dir(child, current_depth + 1)
             elif child.name == "requirements.yaml":
                 found_files.append(child)
@@ -95,6 +99,7 @@ def _extract_first_comment(
     return "".join(comment_strings)
 
 
+@functools.lru_cache
 def _identifier(identifier: int, selector: str | None) -> str:
     """Return a unique identifier based on the comment."""
     platforms = None if selector is None else tuple(platforms_from_selector(selector))
@@ -192,7 +197,7 @@ def _load(p: Path, yaml: YAML) -> dict[str, Any]:
                 project_dependency_handling,
             )
             return unidep_cfg
-    with p.open() as f:
+    with p.open("rb") as f:
         return yaml.load(f)
 
 
@@ -341,11 +346,13 @@ def _move_local_optional_dependencies_to_local_dependencies(
     verbose: bool = False,
 ) -> None:
     # Move local dependencies from `optional_dependencies` to `local_dependencies`
+    if "optional_dependencies" not in data:
+        return  # e.g., a file with only `channels` or `dependencies`
+    optional_dependencies = data["optional_dependencies"]
     extras = path_with_extras.extras
     if "*" in extras:
-        extras = list(data.get("optional_dependencies", {}).keys())
+        extras = list(optional_dependencies.keys())
 
-    optional_dependencies = data.get("optional_dependencies", {})
     for extra in extras:
         moved = set()
         for dep in optional_dependencies.get(extra, []):
@@ -35,6 +35,8 @@ except ImportError:  # pragma: no cover
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from setuptools import Distribution
 
     from unidep.platform_definitions import (
@@ -65,34 +67,33 @@ def filter_python_dependencies(
     """
     pip_deps = []
     for platform_data in resolved.values():
-        to_process: dict[Platform | None, Spec] = {}  # platform -> Spec
-        for _platform, sources in platform_data.items():
-            pip_spec = sources.get("pip")
-            if pip_spec:
-                to_process[_platform] = pip_spec
+        to_process: dict[Platform | None, Spec] = {  # platform -> Spec
+            _platform: sources["pip"]
+            for _platform, sources in platform_data.items()
+            if "pip" in sources
+        }
         if not to_process:
             continue
 
-        # Check if all Spec objects are identical
-        first_spec = next(iter(to_process.values()))
-        if all(spec == first_spec for spec in to_process.values()):
-            # Build a single combined environment marker
-            dep_str = first_spec.name_with_pin(is_pip=True)
-            if _platform is not None:
-                selector = build_pep508_environment_marker(list(to_process.keys()))  # type: ignore[arg-type]
-                dep_str = f"{dep_str}; {selector}"
-            pip_deps.append(dep_str)
+        if len(set(to_process.values())) == 1:
+            # All Spec objects are identical, build a single combined marker
+            pip_deps.append(_pip_dep_str(next(iter(to_process.values())), to_process))
             continue
 
         for _platform, pip_spec in to_process.items():
-            dep_str = pip_spec.name_with_pin(is_pip=True)
-            if _platform is not None:
-                selector = build_pep508_environment_marker([_platform])
-                dep_str = f"{dep_str}; {selector}"
-            pip_deps.append(dep_str)
+            pip_deps.append(_pip_dep_str(pip_spec, [_platform]))
     return sorted(pip_deps)
 
 
+def _pip_dep_str(spec: Spec, platforms: Collection[Platform | None]) -> str:
+    """Return the PEP 508 requirement string for `spec` on `platforms`."""
+    dep_str = spec.name_with_pin(is_pip=True)
+    if None in platforms:
+        return dep_str
+    marker = build_pep508_environment_marker(list(platforms))  # type: ignore[arg-type]
+    return f"{dep_str}; {marker}"
+
+
 class Dependencies(NamedTuple):
     dependencies: list[str]
     extras: dict[str, list[str]]
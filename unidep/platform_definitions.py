@@ -5,6 +5,7 @@ Types and definitions for platforms, selectors, and markers.
 
 from __future__ import annotations
 
+import functools
 import sys
 from typing import NamedTuple, cast
 
@@ -49,6 +50,8 @@ Selector = Literal[
 CondaPip = Literal["conda", "pip"]
 
 VALID_SELECTORS = get_args(Selector)
+VALID_PLATFORMS: tuple[Platform, ...] = get_args(Platform)
+VALID_CONDA_PLATFORMS: tuple[CondaPlatform, ...] = get_args(CondaPlatform)
 
 PEP508_MARKERS = {
     "linux-64": "sys_platform == 'linux' and platform_machine == 'x86_64'",
@@ -81,10 +84,14 @@ PLATFORM_SELECTOR_MAP: dict[Platform, list[Selector]] = {
     "win-64": ["win64", "win"],
 }
 
-PLATFORM_SELECTOR_MAP_REVERSE: dict[Selector, set[Platform]] = {}
-for _platform, _selectors in PLATFORM_SELECTOR_MAP.items():
-    for _selector in _selectors:
-        PLATFORM_SELECTOR_MAP_REVERSE.setdefault(_selector, set()).add(_platform)
+PLATFORM_SELECTOR_MAP_REVERSE: dict[Selector, frozenset[Platform]] = {
+    _selector: frozenset(
+        _platform
+        for _platform, _selectors in PLATFORM_SELECTOR_MAP.items()
+        if _selector in _selectors
+    )
+    for _selector in VALID_SELECTORS
+}
 
 
 def validate_selector(selector: Selector) -> None:
@@ -95,11 +102,8 @@ def validate_selector(selector: Selector) -> None:
         raise ValueError(msg)
 
 
-def platforms_from_selector(selector: str) -> list[Platform]:
-    """Extract platforms from a selector.
-
-    For example, selector can be ``'linux64 win64'`` or ``'osx'``.
-    """
+@functools.lru_cache
+def _platforms_from_selector(selector: str) -> tuple[Platform, ...]:
     # we support a very limited set of selectors that adhere to platform only
     # refs:
     # https://docs.conda.io/projects/conda-build/en/latest/resources/define-metadata.html#preprocessing-selectors
@@ -107,8 +111,17 @@ def platforms_from_selector(selector: str) -> list[Platform]:
     platforms: set[Platform] = set()
     for s in selector.split():
         s = cast(Selector, s)
-        platforms |= set(PLATFORM_SELECTOR_MAP_REVERSE[s])
-    return sorted(platforms)
+        platforms |= PLATFORM_SELECTOR_MAP_REVERSE[s]
+    return tuple(sorted(platforms))
+
+
+def platforms_from_selector(selector: str) -> list[Platform]:
+    """Extract platforms from a selector.
+
+    For example, selector can be ``'linux64 win64'`` or ``'osx'``.
+    """
+    # Cached as a tuple so callers can't mutate the shared result
+    return list(_platforms_from_selector(selector))
 
 
 class Spec(NamedTuple):
@@ -6,6 +6,7 @@ This module provides utility functions used throughout the package.
 from __future__ import annotations
 
 import codecs
+import functools
 import platform
 import re
 import sys
@@ -33,25 +34,29 @@ except ImportError:  # pragma: no cover
     HAS_TOML = False
 
 
+def _header_comment(extra_lines: list[str] | None = None) -> str:
+    """Return the comment that `add_comment_to_file` puts at the top of a file."""
+    if extra_lines is None:
+        extra_lines = []
+    command_line_args = " ".join(sys.argv[1:])
+    txt = [
+        f"# This file is created and managed by `unidep` {__version__}.",
+        "# For details see https://github.com/basnijholt/unidep",
+        f"# File generated with: `unidep {command_line_args}`",
+        *extra_lines,
+    ]
+    return "\n".join(txt) + "\n\n"
+
+
 def add_comment_to_file(
     filename: str | Path,
     extra_lines: list[str] | None = None,
 ) -> None:
     """Add a comment to the top of a file."""
-    if extra_lines is None:
-        extra_lines = []
     with open(filename, "r+") as f:  # noqa: PTH123
         content = f.read()
         f.seek(0, 0)
-        command_line_args = " ".join(sys.argv[1:])
-        txt = [
-            f"# This file is created and managed by `unidep` {__version__}.",
-            "# For details see https://github.com/basnijholt/unidep",
-            f"# File generated with: `unidep {command_line_args}`",
-            *extra_lines,
-        ]
-        content = "\n".join(txt) + "\n\n" + content
-        f.write(content)
+        f.write(_header_comment(extra_lines) + content)
 
 
 def remove_top_comments(filename: str | Path) -> None:
@@ -73,6 +78,9 @@ def escape_unicode(string: str) -> str:
     return codecs.decode(string, "unicode_escape")
 
 
+_BUILD_SYSTEM_RE = re.compile(rb"^\s*\[build-system\]", re.MULTILINE)
+
+
 def is_pip_installable(folder: str | Path) -> bool:  # pragma: no cover
     """Determine if the project is pip installable.
 
@@ -93,10 +101,8 @@ def is_pip_installable(folder: str | Path) -> bool:  # pragma: no cover
                 pyproject_data = tomllib.load(file)
                 return "build-system" in pyproject_data
         else:
-            with pyproject_path.open("r") as file:
-                for line in file:
-                    if line.strip().startswith("[build-system]"):
-                        return True
+            data = pyproject_path.read_bytes()
+            return _BUILD_SYSTEM_RE.search(data) is not None
     return False
 
 
@@ -138,12 +144,18 @@ def build_pep508_environment_marker(
     platforms: list[Platform | tuple[Platform, ...]],
 ) -> str:
     """Generate a PEP 508 selector for a list of platforms."""
-    sorted_platforms = tuple(sorted(platforms))
+    return _pep508_environment_marker(tuple(sorted(platforms)))
+
+
+@functools.lru_cache
+def _pep508_environment_marker(
+    sorted_platforms: tuple[Platform | tuple[Platform, ...], ...],
+) -> str:
     if sorted_platforms in PEP508_MARKERS:
         return PEP508_MARKERS[sorted_platforms]  # type: ignore[index]
     environment_markers = [
         PEP508_MARKERS[platform]
-        for platform in sorted(sorted_platforms)
+        for platform in sorted_platforms
         if platform in PEP508_MARKERS
     ]
     return " or ".join(environment_markers)
@@ -158,16 +170,21 @@ class ParsedPackageStr(NamedTuple):
     selector: str | None = None
 
 
+# Regex to match package name, version pinning, and optionally platform selector
+# Note: the name pattern currently allows for paths and extras, however,
+# paths cannot contain spaces or contain brackets.
+_NAME_PATTERN = r"[a-zA-Z0-9_.\-/]+(\[[a-zA-Z0-9_.,\-]+\])?"
+_VERSION_PIN_PATTERN = r".*?"
+_SELECTOR_PATTERN = r"[a-z0-9\s]+"
+_PACKAGE_STR_RE = re.compile(
+    rf"({_NAME_PATTERN})\s*({_VERSION_PIN_PATTERN})?(:({_SELECTOR_PATTERN}))?$",
+)
+
+
+@functools.lru_cache
 def parse_package_str(package_str: str) -> ParsedPackageStr:
     """Splits a string into package name, version pinning, and platform selector."""
-    # Regex to match package name, version pinning, and optionally platform selector
-    # Note: the name_pattern currently allows for paths and extras, however,
-    # paths cannot contain spaces or contain brackets.
-    name_pattern = r"[a-zA-Z0-9_.\-/]+(\[[a-zA-Z0-9_.,\-]+\])?"
-    version_pin_pattern = r".*?"
-    selector_pattern = r"[a-z0-9\s]+"
-    pattern = rf"({name_pattern})\s*({version_pin_pattern})?(:({selector_pattern}))?$"
-    match = re.match(pattern, package_str)
+    match = _PACKAGE_STR_RE.match(package_str)
 
     if match:
         package_name = match.group(1).strip()
@@ -219,15 +236,17 @@ def warn(
         warnings.formatwarning = original_format
 
 
+_MULTIPLE_BRACKETS_RE = re.compile(r"#.*\].*\[")  # Detects multiple brackets
+_SELECTOR_RE = re.compile(r"#\s*\[([^\[\]]+)\]")
+
+
 def selector_from_comment(comment: str) -> str | None:
     """Extract a valid selector from a comment."""
-    multiple_brackets_pat = re.compile(r"#.*\].*\[")  # Detects multiple brackets
-    if multiple_brackets_pat.search(comment):
+    if _MULTIPLE_BRACKETS_RE.search(comment):
         msg = f"Multiple bracketed selectors found in comment: '{comment}'"
         raise ValueError(msg)
 
-    sel_pat = re.compile(r"#\s*\[([^\[\]]+)\]")
-    m = sel_pat.search(comment)
+    m = _SELECTOR_RE.search(comment)
     if not m:
         return None
     selectors = m.group(1).strip().split()
@@ -262,6 +281,9 @@ def unidep_configured_in_toml(path: Path) -> bool:
     )
 
 
+_PATH_WITH_EXTRAS_RE = re.compile(r"^(.+?)(?:\[([^\[\]]+)\])?$")
+
+
 def split_path_and_extras(input_str: str | Path) -> tuple[Path, list[str]]:
     """Parse a string of the form `path/to/file[extra1,extra2]` into parts.
 
@@ -273,8 +295,7 @@ def split_path_and_extras(input_str: str | Path) -> tuple[Path, list[str]]:
     if not input_str:  # Check for empty string
         return Path(), []
 
-    pattern = r"^(.+?)(?:\[([^\[\]]+)\])?$"
-    match = re.search(pattern, input_str)
+    match = _PATH_WITH_EXTRAS_RE.search(input_str)
 
     if match is None:  # pragma: no cover
         # I don't think this is possible, but just in case